@@ -499,7 +499,9 @@ class Signal(np.ndarray):
             times = np.linspace(0.0, self.duration, N, endpoint=False)
         else:
             times = self.times()
-        cepstrum, ndelay = complex_cepstrum(self, n=N)
+        # Pass the length explicitly: the library default pads to the next
+        # fast FFT length, which would misalign the cepstrum with `times`.
+        cepstrum, ndelay = complex_cepstrum(self, n=N if N is not None else self.samples)
         return times, cepstrum, ndelay
 
     def real_cepstrum(self, N=None):
@@ -520,7 +522,9 @@ class Signal(np.ndarray):
             times = np.linspace(0.0, self.duration, N, endpoint=False)
         else:
             times = self.times()
-        return times, real_cepstrum(self, n=N)
+        # Pass the length explicitly: the library default pads to the next
+        # fast FFT length, which would misalign the cepstrum with `times`.
+        return times, real_cepstrum(self, n=N if N is not None else self.samples)
 
     def power_spectrum(self, N: int | None = None):
         """Power spectrum.
@@ -13,20 +13,214 @@ Notes:
 """
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from typing import Tuple, Optional
+from functools import lru_cache
+
+from scipy.fft import next_fast_len
+from scipy.linalg.blas import daxpy
+
+try:
+    import pyfftw  # Caches plans across repeated same-length transforms.
+
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    from pyfftw.interfaces.scipy_fft import fft, ifft, rfft, irfft
+except ImportError:
+    pyfftw = None
+    from scipy.fft import (  # Threaded, unlike numpy's pocketfft.
+        fft,
+        ifft,
+        rfft,
+        irfft,
+    )
+
+try:
+    from numba import njit
+except ImportError:  # Phase unwrapping falls back to np.unwrap.
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  # The complex exponential falls back to numpy.
+    numexpr = None
+
+try:
+    import cupy
+except ImportError:  # backend="cupy" is then unavailable.
+    cupy = None
+
+
+@lru_cache(maxsize=32)
+def _pi_ramp(samples: int, center: int) -> NDArray[np.float64]:
+    """Cached phase correction ramp `pi * arange(samples) / center`.
+
+    Frame-based pipelines call the cepstrum routines repeatedly with a fixed
+    length; caching the ramp avoids one allocation and two per-element ops on
+    every call. The scalar `pi / center` is applied once here so callers only
+    scale by `ndelay`. The returned array is shared and must not be mutated.
+
+    Args:
+      samples: Length of the ramp.
+      center: Divisor applied to the ramp.
+
+    Returns:
+      The phase correction ramp.
+    """
+    return np.arange(samples, dtype=np.float64) * (np.pi / center)
+
+
+def _log_magnitude(spectrum: NDArray[np.complexfloating]) -> NDArray[np.floating]:
+    """Compute `log|S|` as `0.5 * log(Sr**2 + Si**2)` in one reusable buffer.
+
+    Working from the power spectrum skips the per-element sqrt inside abs and
+    keeps the whole chain in-place via out= parameters. The tiny offset keeps
+    exact spectral zeros finite instead of propagating -inf.
+
+    Args:
+      spectrum: Complex (half-)spectrum.
+
+    Returns:
+      The log-magnitude spectrum, in a freshly allocated real buffer.
+    """
+    out = np.multiply(spectrum.real, spectrum.real)
+    out += spectrum.imag * spectrum.imag
+    out += np.finfo(out.dtype).tiny
+    np.log(out, out=out)
+    out *= 0.5
+    return out
+
+
+def _check_backend(backend: str) -> None:
+    """Validate the `backend` argument of the cepstrum routines.
+
+    Args:
+      backend: Requested compute backend.
+    """
+    if backend not in ("cpu", "cupy"):
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "cupy" and cupy is None:
+        raise ImportError("backend='cupy' requires the cupy package.")
+
+
+def _complex_cepstrum_cupy(
+    x: NDArray[np.floating], n: int, dtype: DTypeLike
+) -> Tuple[NDArray[np.floating], NDArray[np.int64], "cupy.ndarray"]:
+    """GPU implementation of `complex_cepstrum` via cuFFT.
+
+    Mirrors the CPU pipeline with the whole spectrum kept resident on the
+    device; only the results are copied back to host memory.
+
+    Args:
+      x: Real sequence(s) of shape `(..., samples)`.
+      n: Length of the Fourier transform.
+      dtype: Working precision.
+
+    Returns:
+      The complex cepstrum, the delay counts, and the device-side unwrapped
+      log spectrum.
+    """
+    spectrum = cupy.fft.fft(cupy.asarray(x, dtype=dtype), n=n, axis=-1)
+    log_spectrum = cupy.log(spectrum)
+    unwrapped = cupy.unwrap(log_spectrum.imag)
+    center = (n + 1) // 2
+    ndelay = cupy.round(unwrapped[..., min(center, n - 1)] / np.pi).astype(cupy.int64)
+    ramp = cupy.arange(n) * (np.pi / max(center, 1))
+    unwrapped -= ndelay[..., None] * ramp
+    log_spectrum = log_spectrum.real + 1j * unwrapped
+    ceps = cupy.fft.ifft(log_spectrum, axis=-1).real
+    return cupy.asnumpy(ceps), cupy.asnumpy(ndelay), log_spectrum
+
+
+def _real_cepstrum_cupy(
+    x: NDArray[np.floating], n: int, dtype: DTypeLike
+) -> NDArray[np.floating]:
+    """GPU implementation of `real_cepstrum` via cuFFT.
+
+    Args:
+      x: Real sequence(s) of shape `(..., samples)`.
+      n: Length of the Fourier transform.
+      dtype: Working precision.
+
+    Returns:
+      The real cepstrum, copied back to host memory.
+    """
+    spectrum = cupy.fft.rfft(cupy.asarray(x, dtype=dtype), n=n, axis=-1)
+    power = spectrum.real * spectrum.real
+    power += spectrum.imag * spectrum.imag
+    power += np.finfo(power.dtype).tiny
+    log_magnitude = 0.5 * cupy.log(power)
+    return cupy.asnumpy(cupy.fft.irfft(log_magnitude, n=n, axis=-1))
+
+
+if njit is not None:
+    from numba import prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _complex_cepstrum_core(
+        spectrum: NDArray[np.complexfloating],
+        out: NDArray[np.complexfloating],
+    ) -> NDArray[np.int64]:
+        """Fused log magnitude, Itoh phase unwrap and delay-ramp correction.
+
+        Walks each frame of the spectrum once: `out` receives
+        `log|S| + i*(unwrapped phase - pi*ndelay*k/center)` directly, instead
+        of the separate angle, unwrap, ramp and log passes of the numpy path.
+        Frames run in parallel; the unwrap recurrence itself is serial.
+
+        Args:
+          spectrum: Complex spectrum of shape `(rows, samples)`.
+          out: Output array of the same shape receiving the log spectrum.
+
+        Returns:
+          The delay count per frame.
+        """
+        rows, samples = spectrum.shape
+        center = (samples + 1) // 2
+        pick = min(center, samples - 1)
+        divisor = max(center, 1)
+        two_pi = 2.0 * np.pi
+        ndelay = np.empty(rows, dtype=np.int64)
+        for j in prange(rows):
+            phase = np.empty(samples)
+            previous = np.arctan2(spectrum[j, 0].imag, spectrum[j, 0].real)
+            unwrapped = previous
+            phase[0] = previous
+            for i in range(1, samples):
+                raw = np.arctan2(spectrum[j, i].imag, spectrum[j, i].real)
+                d = raw - previous
+                d -= two_pi * np.round(d / two_pi)
+                unwrapped += d
+                phase[i] = unwrapped
+                previous = raw
+            delay = np.int64(round(phase[pick] / np.pi))
+            ndelay[j] = delay
+            slope = delay * np.pi / divisor
+            for i in range(samples):
+                sr = spectrum[j, i].real
+                si = spectrum[j, i].imag
+                out[j, i] = complex(
+                    0.5 * np.log(sr * sr + si * si), phase[i] - slope * i
+                )
+        return ndelay
+
 
 __all__ = [
     "complex_cepstrum",
     "real_cepstrum",
     "inverse_complex_cepstrum",
     "minimum_phase",
+    "make_real_cepstrum",
 ]
 
 
 def complex_cepstrum(
-    x: NDArray[np.float64], n: Optional[int] = None
-) -> Tuple[NDArray[np.float64], NDArray[np.int_]]:
+    x: NDArray[np.float64],
+    n: Optional[int] = None,
+    dtype: DTypeLike = np.float64,
+    return_log_spectrum: bool = False,
+    backend: str = "cpu",
+) -> Tuple[NDArray[np.floating], ...]:
     r"""Compute the complex cepstrum of a real sequence.
 
     The complex cepstrum is given by:
@@ -39,12 +233,26 @@ def complex_cepstrum(
 
 
     Args:
-      x: Real sequence to compute complex cepstrum of.
-      n: Length of the Fourier transform.
+      x: Real sequence to compute complex cepstrum of. May be a stack of
+        frames of shape `(..., samples)`; the cepstrum is computed along the
+        last axis in a single batched transform.
+      n: Length of the Fourier transform. Defaults to the next fast composite
+        length at or above the signal length (`scipy.fft.next_fast_len`),
+        which may pad the output; pass `n=x.shape[-1]` to keep the exact
+        signal length.
+      dtype: Working precision. `np.float32` halves memory traffic on large
+        transforms at the cost of single precision in the result.
+      return_log_spectrum: Also return the unwrapped log spectrum, which
+        [`inverse_complex_cepstrum`][acoustic_toolbox.cepstrum.inverse_complex_cepstrum]
+        can reuse to skip its forward transform.
+      backend: `"cpu"` (default) or `"cupy"` to run the pipeline on the GPU
+        via cuFFT. Worthwhile for megasample signals or large frame stacks;
+        requires the optional cupy package.
 
     Returns:
       The complex cepstrum of the real data sequence `x` computed using the Fourier transform.
       The amount of samples of circular delay added to `x`.
+      The unwrapped log spectrum, if `return_log_spectrum` is set.
 
 
     See Also:
@@ -96,7 +304,7 @@ def complex_cepstrum(
 
     def _unwrap(
         phase: NDArray[np.float64],
-    ) -> Tuple[NDArray[np.float64], NDArray[np.int_]]:
+    ) -> Tuple[NDArray[np.float64], NDArray[np.int64]]:
         """Unwrap phase values.
 
         Args:
@@ -108,24 +316,64 @@ def complex_cepstrum(
         """
         samples = phase.shape[-1]
         unwrapped = np.unwrap(phase)
+        # For samples == 1 the correction ramp is [0.] whatever the divisor,
+        # so clamping with min/max replaces the old `center = 0` branch, which
+        # divided by zero in the ramp and produced NaN.
         center = (samples + 1) // 2
-        if samples == 1:
-            center = 0
-        ndelay = np.array(np.round(unwrapped[..., center] / np.pi))
-        unwrapped -= np.pi * ndelay[..., None] * np.arange(samples) / center
+        ndelay = np.asarray(
+            np.round(unwrapped[..., min(center, samples - 1)] / np.pi),
+            dtype=np.int64,
+        )
+        ramp = _pi_ramp(samples, max(center, 1))
+        if unwrapped.ndim == 1 and unwrapped.dtype == np.float64:
+            # Single fused BLAS pass: unwrapped += -ndelay * ramp.
+            unwrapped = daxpy(ramp, unwrapped, a=-float(ndelay))
+        else:
+            correction = np.multiply(ndelay[..., None], ramp)
+            np.subtract(unwrapped, correction, out=unwrapped)
         return unwrapped, ndelay
 
-    spectrum = np.fft.fft(x, n=n)
-    unwrapped_phase, ndelay = _unwrap(np.angle(spectrum))
-    log_spectrum = np.log(np.abs(spectrum)) + 1j * unwrapped_phase
-    ceps = np.fft.ifft(log_spectrum).real
-
+    _check_backend(backend)
+    x = np.asarray(x, dtype=dtype)
+    if n is None:
+        # Awkward (e.g. prime) lengths fall into slow FFT radix paths; pad to
+        # the nearest fast composite length instead.
+        n = next_fast_len(x.shape[-1])
+    if backend == "cupy":
+        ceps, ndelay, log_spectrum_gpu = _complex_cepstrum_cupy(x, n, dtype)
+        if return_log_spectrum:
+            return ceps, ndelay, cupy.asnumpy(log_spectrum_gpu)
+        return ceps, ndelay
+    spectrum = fft(x, n=n, axis=-1, workers=-1)
+    if njit is not None:
+        # Fused kernel: log magnitude, unwrap and ramp correction in one
+        # streaming pass per frame.
+        framed = spectrum.reshape(-1, n)
+        log_spectrum = np.empty_like(framed)
+        ndelay = _complex_cepstrum_core(framed, log_spectrum)
+        log_spectrum = log_spectrum.reshape(spectrum.shape)
+        ndelay = ndelay.reshape(spectrum.shape[:-1])
+    else:
+        # The complex log gives log|S| + i*angle(S) in a single pass,
+        # replacing separate abs, log and angle passes (and their
+        # temporaries). The spectrum is not needed afterwards, so reuse its
+        # buffer.
+        log_spectrum = np.log(spectrum, out=spectrum)
+        unwrapped_phase, ndelay = _unwrap(log_spectrum.imag)
+        log_spectrum.imag[...] = unwrapped_phase
+    ceps = ifft(log_spectrum, axis=-1, workers=-1).real
+
+    if return_log_spectrum:
+        return ceps, ndelay, log_spectrum
     return ceps, ndelay
 
 
 def real_cepstrum(
-    x: NDArray[np.float64], n: Optional[int] = None
-) -> NDArray[np.float64]:
+    x: NDArray[np.float64],
+    n: Optional[int] = None,
+    dtype: DTypeLike = np.float64,
+    backend: str = "cpu",
+) -> NDArray[np.floating]:
     r"""Compute the real cepstrum of a real sequence.
 
     The real cepstrum is given by:
@@ -139,8 +387,18 @@ def real_cepstrum(
     Note that contrary to the complex cepstrum the magnitude is taken of the spectrum.
 
     Args:
-      x: Real sequence to compute real cepstrum of.
-      n: Length of the Fourier transform.
+      x: Real sequence to compute real cepstrum of. May be a stack of frames
+        of shape `(..., samples)`; the cepstrum is computed along the last
+        axis in a single batched transform.
+      n: Length of the Fourier transform. Defaults to the next fast composite
+        length at or above the signal length (`scipy.fft.next_fast_len`),
+        which may pad the output; pass `n=x.shape[-1]` to keep the exact
+        signal length.
+      dtype: Working precision. `np.float32` halves memory traffic on large
+        transforms at the cost of single precision in the result.
+      backend: `"cpu"` (default) or `"cupy"` to run the pipeline on the GPU
+        via cuFFT. Worthwhile for megasample signals or large frame stacks;
+        requires the optional cupy package.
 
     Returns:
       The real cepstrum.
@@ -157,14 +415,76 @@ def real_cepstrum(
       1. Wikipedia, "Cepstrum".
           [http://en.wikipedia.org/wiki/Cepstrum](http://en.wikipedia.org/wiki/Cepstrum)
     """
-    spectrum = np.fft.fft(x, n=n)
-    ceps = np.fft.ifft(np.log(np.abs(spectrum))).real
+    _check_backend(backend)
+    x = np.asarray(x, dtype=dtype)
+    if n is None:
+        # Awkward (e.g. prime) lengths fall into slow FFT radix paths; pad to
+        # the nearest fast composite length instead.
+        n = next_fast_len(x.shape[-1])
+    if backend == "cupy":
+        return _real_cepstrum_cupy(x, n, dtype)
+    # The log-magnitude spectrum of a real sequence is even-symmetric, so the
+    # half-length rfft/irfft pair gives the same result as a full complex FFT.
+    spectrum = rfft(x, n=n, axis=-1, workers=-1)
+    ceps = irfft(_log_magnitude(spectrum), n=n, axis=-1, workers=-1)
 
     return ceps
 
 
+def make_real_cepstrum(n: int, dtype: DTypeLike = np.float64):
+    """Build a `real_cepstrum` specialized for a fixed transform length.
+
+    Feature pipelines call the cepstrum thousands of times with one frame
+    length. The returned callable bakes in the transform length and working
+    precision; with pyfftw installed it owns a pinned pair of FFTW plans and
+    aligned buffers, so repeated calls skip planning and plan-cache lookups
+    entirely. Without pyfftw it simply forwards to
+    [`real_cepstrum`][acoustic_toolbox.cepstrum.real_cepstrum] with the
+    length frozen.
+
+    Args:
+      n: Fixed length of the Fourier transform.
+      dtype: Working precision of the pipeline.
+
+    Returns:
+      A callable mapping a length-`n` real sequence to its real cepstrum.
+
+    See Also:
+      - [`real_cepstrum`][acoustic_toolbox.cepstrum.real_cepstrum]: Compute the real cepstrum.
+
+    Examples:
+      >>> from acoustic_toolbox.cepstrum import make_real_cepstrum
+      >>> real_cepstrum_512 = make_real_cepstrum(512)
+    """
+    dtype = np.dtype(dtype)
+
+    if pyfftw is None:
+
+        def real_cepstrum_fixed(x: NDArray[np.floating]) -> NDArray[np.floating]:
+            return real_cepstrum(x, n=n, dtype=dtype)
+
+        return real_cepstrum_fixed
+
+    complex_dtype = np.result_type(dtype, np.complex64)
+    signal_buffer = pyfftw.empty_aligned(n, dtype=dtype)
+    forward = pyfftw.builders.rfft(signal_buffer, n=n)
+    spectrum_buffer = pyfftw.empty_aligned(n // 2 + 1, dtype=complex_dtype)
+    backward = pyfftw.builders.irfft(spectrum_buffer, n=n)
+
+    def real_cepstrum_fixed(x: NDArray[np.floating]) -> NDArray[np.floating]:
+        signal_buffer[...] = x
+        spectrum_buffer[...] = _log_magnitude(forward())
+        # The plan writes into its own output array; hand back a copy so the
+        # caller's result survives the next call.
+        return backward().copy()
+
+    return real_cepstrum_fixed
+
+
 def inverse_complex_cepstrum(
-    ceps: NDArray[np.float64], ndelay: NDArray[np.int_]
+    ceps: NDArray[np.float64],
+    ndelay: NDArray[np.int64],
+    log_spectrum: Optional[NDArray[np.complexfloating]] = None,
 ) -> NDArray[np.float64]:
     r"""Compute the inverse complex cepstrum of a real sequence.
 
@@ -176,8 +496,13 @@ def inverse_complex_cepstrum(
     where $c[n]$ is the input signal and $F$ and $F^{-1}$ are respectively the forward and backward Fourier transform.
 
     Args:
-      ceps: Real sequence to compute inverse complex cepstrum of.
+      ceps: Real sequence to compute inverse complex cepstrum of. May be a
+        stack of frames of shape `(..., samples)`.
       ndelay: The amount of samples of circular delay added to `x`.
+      log_spectrum: Unwrapped log spectrum as returned by
+        [`complex_cepstrum`][acoustic_toolbox.cepstrum.complex_cepstrum] with
+        `return_log_spectrum=True`. When given, the forward transform of
+        `ceps` is skipped, saving one FFT on the round trip.
 
     Returns:
       The inverse complex cepstrum of the real sequence `ceps`.
@@ -204,7 +529,7 @@ def inverse_complex_cepstrum(
     """
 
     def _wrap(
-        phase: NDArray[np.float64], ndelay: NDArray[np.int_]
+        phase: NDArray[np.float64], ndelay: NDArray[np.int64]
     ) -> NDArray[np.float64]:
         """Wrap phase values.
 
@@ -215,26 +540,47 @@ def inverse_complex_cepstrum(
         Returns:
           Wrapped phase values.
         """
-        ndelay = np.array(ndelay)
+        ndelay = np.asarray(ndelay)  # No copy when already an array.
         samples = phase.shape[-1]
         center = (samples + 1) // 2
-        wrapped = phase + np.pi * ndelay[..., None] * np.arange(samples) / center
+        # Build the correction once and add the phase into it in place,
+        # instead of allocating both the scaled ramp and the sum.
+        wrapped = np.multiply(ndelay[..., None], _pi_ramp(samples, center))
+        wrapped += phase
         return wrapped
 
-    log_spectrum = np.fft.fft(ceps)
-    spectrum = np.exp(log_spectrum.real + 1j * _wrap(log_spectrum.imag, ndelay))
-    x = np.fft.ifft(spectrum).real
+    if log_spectrum is None:
+        log_spectrum = fft(ceps, axis=-1, workers=-1)
+    wrapped = _wrap(log_spectrum.imag, ndelay)
+    if numexpr is not None:
+        # exp(a + ib) in one threaded pass, without assembling the complex
+        # a + ib temporary first.
+        spectrum = numexpr.evaluate(
+            "exp(a) * (cos(b) + 1j * sin(b))",
+            local_dict={"a": log_spectrum.real, "b": wrapped},
+        )
+    else:
+        # Assemble a + ib once and exponentiate it in place instead of
+        # allocating a fresh array per binary op.
+        spectrum = np.multiply(wrapped, 1j)
+        spectrum += log_spectrum.real
+        np.exp(spectrum, out=spectrum)
+    x = ifft(spectrum, axis=-1, workers=-1).real
     return x
 
 
 def minimum_phase(
-    x: NDArray[np.float64], n: Optional[int] = None
+    x: NDArray[np.float64], n: Optional[int] = None, fast_len: bool = False
 ) -> NDArray[np.float64]:
     """Compute the minimum phase reconstruction of a real sequence.
 
     Args:
       x: Real sequence to compute the minimum phase reconstruction of.
       n: Length of the Fourier transform.
+      fast_len: Run the internal transforms at the next fast composite length
+        and truncate the result to `n` samples. Much faster for awkward
+        (e.g. prime) lengths; the reconstruction differs slightly because the
+        cepstral lifter then acts on the padded length.
 
     Returns:
       The minimum phase reconstruction of the real sequence `x`.
@@ -252,19 +598,28 @@ def minimum_phase(
           Real Cepstrum. IEEE TRANSACTIONS ON CIRCUITS AND SYSTEMS-II:
           EXPRESS BRIEFS, VOL. 53, NO. 10, OCTOBER 2006
     """
+    x = np.asarray(x)
     if n is None:
-        n = len(x)
-    ceps = real_cepstrum(x, n=n)
-    odd = n % 2
-    window = np.concatenate(
-        (
-            [1.0],
-            2.0 * np.ones((n + odd) // 2 - 1),
-            np.ones(1 - odd),
-            np.zeros((n + odd) // 2 - 1),
-        )
-    )
-
-    m = np.fft.ifft(np.exp(np.fft.fft(window * ceps))).real
-
-    return m
+        n = x.shape[-1]
+    nfft = next_fast_len(n) if fast_len else n
+    ceps = real_cepstrum(x, n=nfft)
+    odd = nfft % 2
+    half = (nfft + odd) // 2
+    # Slice-assign the lifter window into one buffer instead of concatenating
+    # four intermediate arrays.
+    window = np.empty(nfft)
+    window[0] = 1.0
+    window[1:half] = 2.0
+    if not odd:
+        window[half] = 1.0
+    window[half + 1 - odd :] = 0.0
+    ceps *= window  # real_cepstrum returned a fresh buffer; reuse it.
+
+    # exp preserves the Hermitian symmetry of the windowed cepstrum's spectrum,
+    # so the real-input rfft/irfft pair suffices here as well; the spectrum
+    # buffer is exponentiated in place.
+    spectrum = rfft(ceps, n=nfft, axis=-1, workers=-1)
+    np.exp(spectrum, out=spectrum)
+    m = irfft(spectrum, n=nfft, axis=-1, workers=-1)
+
+    return m[..., :n]
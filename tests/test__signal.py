@@ -140,6 +140,18 @@ class TestSignal:
     def test_real_cepstrum(self, signal):
         t, c = signal.real_cepstrum()
 
+    def test_complex_cepstrum_awkward_length(self):
+        # The quefrency axis and the cepstrum must stay aligned for lengths
+        # that are not fast FFT lengths.
+        signal = Signal(np.random.randn(10007), 8000)
+        t, c, d = signal.complex_cepstrum()
+        assert t.shape[-1] == c.shape[-1] == signal.samples
+
+    def test_real_cepstrum_awkward_length(self):
+        signal = Signal(np.random.randn(10007), 8000)
+        t, c = signal.real_cepstrum()
+        assert t.shape[-1] == c.shape[-1] == signal.samples
+
     def test_power_spectrum(self, signal):
         freq, power = signal.power_spectrum()
 
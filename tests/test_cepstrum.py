@@ -20,6 +20,17 @@ class TestCepstrum:
         ceps, _ = complex_cepstrum(signal)
         assert fundamental == 1.0 / t[ceps.argmax()]
 
+    def test_complex_cepstrum_frames(self):
+        """A stack of frames should give the same result as processing each
+        frame individually.
+        """
+        frames = np.random.RandomState(0).randn(4, 64) + 2.0
+        ceps, ndelay = complex_cepstrum(frames)
+        for i, frame in enumerate(frames):
+            ceps_i, ndelay_i = complex_cepstrum(frame)
+            assert_array_almost_equal(ceps[i], ceps_i)
+            assert ndelay[i] == ndelay_i
+
     def test_inverse_complex_cepstrum(self):
         """Applying the complex cepstrum and then the inverse complex cepstrum
         should result in the original sequence.